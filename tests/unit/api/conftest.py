@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2025-present Krys Lawrence <aquarion.5.krystopher@spamgourmet.org>
+# SPDX-License-Identifier: AGPL-3.0-only
+
+# Part of the aquarion-libtts library of the Aquarion AI project.
+# Copyright (C) 2025-present Krys Lawrence <aquarion.5.krystopher@spamgourmet.org>
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Shared fixtures and code for api package tests."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from aquarion.libs.libtts.api import JSONSerializableTypes
+
+# Patterns shared by many pytest.raises() calls, compiled once.
+MISSING_ARGUMENT_PATTERN: Final = re.compile(r"missing .* required positional argument")
+INCORRECT_SETTINGS_PATTERN: Final = re.compile("Incorrect settings type")
+MISSING_KEYWORD_ARGUMENT_PATTERN: Final = re.compile(
+    r"missing .* required keyword-only argument"
+)
+FROZEN_FIELD_PATTERN: Final = re.compile("cannot assign to field")
+
+
+@dataclass(slots=True)
+class DummyTTSSettings:
+    """Dummy ITTSSettings to test the protocol.
+
+    Specific implementations here do not matter, the only important thing is to conform
+    to the ITTSSettings protocol.
+    """
+
+    attr1: str = "default"
+    locale: str = field(default="en-CA", init=False, compare=False)
+
+    def to_dict(self) -> dict[str, JSONSerializableTypes]:
+        return {"attr1": self.attr1}
+
+
+class AnotherTTSSettings:  # noqa: PLW1641
+    """NOT the DummyTTSSettings class."""
+
+    __slots__ = ()
+
+    # These need to exist to conform to the ITTSSetting protocol, but are not actually
+    # used or needed for the tests.
+
+    locale = "fr-CA"
+
+    def __eq__(self, other: object) -> bool:
+        return False  # pragma: no cover
+
+    def to_dict(self) -> dict[str, JSONSerializableTypes]:
+        return {}  # pragma: no cover
+
+
+# AnotherTTSSettings has no state, so tests that only need a wrong kind of settings
+# can all share this one instance.
+ANOTHER_SETTINGS: Final = AnotherTTSSettings()
@@ -30,6 +30,7 @@ from babel import UnknownLocaleError
 from logot import Logot, logged
 
 from aquarion.libs.libtts.api._i18n import HashableTraversable, load_language
+from tests.unit.api.conftest import MISSING_ARGUMENT_PATTERN
 
 ### load_language Tests ###
 
@@ -52,17 +53,17 @@ def test_load_language_should_accept_a_local_path_of_type_traversable() -> None:
 
 
 def test_load_language_should_require_the_locale_argument() -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         load_language(domain="some domain", locale_path="some path")
 
 
 def test_load_language_should_require_the_domain_argument() -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         load_language(locale="en_CA", locale_path="some path")
 
 
 def test_load_language_should_require_the_locale_path_argument() -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         load_language(locale="en_CA", domain="some domain")
 
 
@@ -33,16 +33,21 @@ from aquarion.libs.libtts.api._ttsbackend import (
     TTSSampleByteOrders,
     TTSSampleTypes,
 )
-from aquarion.libs.libtts.api._ttssettings import ITTSSettings
-from tests.unit.api.ttssettings_test import (
-    AnotherTTSSettings,
+from tests.unit.api.conftest import (
+    ANOTHER_SETTINGS,
+    FROZEN_FIELD_PATTERN,
+    INCORRECT_SETTINGS_PATTERN,
+    MISSING_ARGUMENT_PATTERN,
+    MISSING_KEYWORD_ARGUMENT_PATTERN,
     DummyTTSSettings,
-    DummyTTSSettingsHolder,
 )
+from tests.unit.api.ttssettings_test import DummyTTSSettingsHolder
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from aquarion.libs.libtts.api._ttssettings import ITTSSettings
+
 type TTSAudioSpecTypes = bytes | str | int
 
 AUDIO_SPEC_REQUIRED_ARGS: Final = {
@@ -53,20 +58,33 @@ AUDIO_SPEC_REQUIRED_ARGS: Final = {
     "byte_order": "big-endian",
     "num_channels": 1,
 }
+AUDIO_SPEC_ARGUMENT_NAMES: Final = tuple(AUDIO_SPEC_REQUIRED_ARGS)
 
 
 ### TTSAudioSpec Tests ###
 
 
+@pytest.fixture(scope="module")
+def audio_spec() -> TTSAudioSpec:
+    """Return a TTSAudioSpec with the required arguments shared across a module.
+
+    TTSAudioSpec is frozen, so tests that only read or try to modify it can share one.
+    """
+    return TTSAudioSpec(**AUDIO_SPEC_REQUIRED_ARGS)  # type:ignore[arg-type]
+
+
 def test_ttsaudiospec_should_accept_required_arguments_as_keyword_arguments() -> None:
     TTSAudioSpec(**AUDIO_SPEC_REQUIRED_ARGS)  # type:ignore[arg-type]
 
 
-@pytest.mark.parametrize("argument", AUDIO_SPEC_REQUIRED_ARGS)
+@pytest.mark.parametrize(
+    "argument", AUDIO_SPEC_ARGUMENT_NAMES, ids=AUDIO_SPEC_ARGUMENT_NAMES
+)
 def test_ttsaudiospec_should_require_required_arguments(argument: str) -> None:
-    arguments = AUDIO_SPEC_REQUIRED_ARGS.copy()
-    del arguments[argument]
-    with pytest.raises(TypeError, match=r"missing .* required keyword-only argument"):
+    arguments = {
+        key: value for key, value in AUDIO_SPEC_REQUIRED_ARGS.items() if key != argument
+    }
+    with pytest.raises(TypeError, match=MISSING_KEYWORD_ARGUMENT_PATTERN):
         TTSAudioSpec(**arguments)  # type:ignore[arg-type]
 
 
@@ -77,30 +95,39 @@ def test_ttsaudiospec_should_require_all_keyword_arguments() -> None:
         TTSAudioSpec(*AUDIO_SPEC_REQUIRED_ARGS.values())  # type:ignore[call-arg]
 
 
-@pytest.mark.parametrize(("attribute", "expected"), AUDIO_SPEC_REQUIRED_ARGS.items())
+@pytest.mark.parametrize(
+    ("attribute", "expected"),
+    AUDIO_SPEC_REQUIRED_ARGS.items(),
+    ids=AUDIO_SPEC_ARGUMENT_NAMES,
+)
 def test_ttsaudiospec_should_store_all_given_values(
     attribute: str,
     expected: TTSAudioSpecTypes,
+    audio_spec: TTSAudioSpec,
 ) -> None:
-    speech_data = TTSAudioSpec(**AUDIO_SPEC_REQUIRED_ARGS)  # type:ignore[arg-type]
-    assert getattr(speech_data, attribute) == expected  # type:ignore[misc]
+    assert getattr(audio_spec, attribute) == expected  # type:ignore[misc]
 
 
-@pytest.mark.parametrize(("attribute", "new_value"), AUDIO_SPEC_REQUIRED_ARGS.items())
+@pytest.mark.parametrize(
+    ("attribute", "new_value"),
+    AUDIO_SPEC_REQUIRED_ARGS.items(),
+    ids=AUDIO_SPEC_ARGUMENT_NAMES,
+)
 def test_ttsaudiospec_attributes_should_be_immutable(
     attribute: str,
     new_value: TTSAudioSpecTypes,
+    audio_spec: TTSAudioSpec,
 ) -> None:
-    speech_data = TTSAudioSpec(**AUDIO_SPEC_REQUIRED_ARGS)  # type:ignore [arg-type]
-    with pytest.raises(AttributeError, match="cannot assign to field"):
-        setattr(speech_data, attribute, new_value)
+    with pytest.raises(AttributeError, match=FROZEN_FIELD_PATTERN):
+        setattr(audio_spec, attribute, new_value)
 
 
-def test_ttsaudiospec_should_not_accept_additional_attributes() -> None:
-    speech_data = TTSAudioSpec(**AUDIO_SPEC_REQUIRED_ARGS)  # type:ignore[arg-type]
+def test_ttsaudiospec_should_not_accept_additional_attributes(
+    audio_spec: TTSAudioSpec,
+) -> None:
     # This exception message is really cryptic and unhelpful.  But the effect works.
     with pytest.raises(TypeError, match="an instance or subtype of type"):
-        speech_data.new_custom_attribute = "new value"  # type:ignore[attr-defined]
+        audio_spec.new_custom_attribute = "new value"  # type:ignore[attr-defined]
 
 
 ### ITTSBackend Tests ###
@@ -113,6 +140,8 @@ class DummyTTSBackend(DummyTTSSettingsHolder):
     to the ITTSBackend protocol.
     """
 
+    __slots__ = ("_is_started",)
+
     def __init__(self) -> None:
         super().__init__()
         self._is_started = False
@@ -163,7 +192,7 @@ def test_ittsbackend_get_settings_should_return_an_ittssettings() -> None:
     backend = DummyTTSBackend()
     settings = backend.get_settings()
     _: ITTSSettings = settings  # Typecheck protocol conformity
-    assert isinstance(settings, ITTSSettings)  # Runtime check as well
+    assert isinstance(settings, DummyTTSSettings)  # Concrete runtime check
 
 
 ## .update_settings tests
@@ -176,7 +205,7 @@ def test_ittsbackend_update_settings_should_accept_a_settings_argument() -> None
 
 def test_ittsbackend_update_settings_should_require_the_settings_argument() -> None:
     backend = DummyTTSBackend()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         backend.update_settings()  # type:ignore[call-arg]
 
 
@@ -199,9 +228,8 @@ def test_ittsbackend_update_settings_should_update_the_settings() -> None:
 
 def test_ittsbackend_update_settings_should_raise_error_if_incorrect_kind() -> None:
     backend = DummyTTSBackend()
-    incorrect_settings = AnotherTTSSettings()
-    with pytest.raises(TypeError, match="Incorrect settings type"):
-        backend.update_settings(incorrect_settings)
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
+        backend.update_settings(ANOTHER_SETTINGS)
 
 
 ## .audio_spec tests
@@ -222,7 +250,7 @@ def test_ittsbackend_audio_spec_should_return_a_ttsaudiospec_instance() -> None:
 
 def test_ittsbackend_convert_should_require_some_text_input() -> None:
     backend = DummyTTSBackend()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         backend.convert()  # type:ignore[call-arg]
 
 
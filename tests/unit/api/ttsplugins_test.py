@@ -20,10 +20,11 @@
 from __future__ import annotations
 
 import importlib
+import re
 from collections.abc import Mapping, MutableSet
 from collections.abc import Set as AbstractSet
 from types import MappingProxyType
-from typing import Final, Never, cast
+from typing import Final, Never
 
 import pytest
 from logot import Logot, logged
@@ -42,8 +43,13 @@ from aquarion.libs.libtts.api._ttssettings import (
     TTSSettingsSpecEntry,
     TTSSettingsSpecEntryTypes,
 )
+from tests.unit.api.conftest import (
+    ANOTHER_SETTINGS,
+    INCORRECT_SETTINGS_PATTERN,
+    MISSING_ARGUMENT_PATTERN,
+    DummyTTSSettings,
+)
 from tests.unit.api.ttsbackend_test import DummyTTSBackend
-from tests.unit.api.ttssettings_test import AnotherTTSSettings, DummyTTSSettings
 
 ### ITTSPlugin Tests ###
 
@@ -62,6 +68,7 @@ DUMMY_ATTR1_DESCRIPTION_EN_CA: Final = "I am attr1's description"
 DUMMY_ATTR1_DESCRIPTION_FR_CA: Final = "Je suis la description de attr1"
 DUMMY_ATTR1_DESCRIPTION_DEFAULT: Final = "I am attr1's default description"
 DUMMY_SUPPORTED_LOCALES: Final = frozenset({"en_CA", "fr_CA"})
+DUMMY_SETTING_NAMES: Final = frozenset({"attr1"})
 
 
 class DummyTTSPlugin:
@@ -94,13 +101,15 @@ class DummyTTSPlugin:
         if from_dict is None:
             settings = DummyTTSSettings()
         else:
-            if "attr2" in from_dict:
-                message = "Invalid setting key: [attr2]"
+            unknown_keys = from_dict.keys() - DUMMY_SETTING_NAMES
+            if unknown_keys:
+                message = f"Invalid setting key: [{', '.join(sorted(unknown_keys))}]"
                 raise KeyError(message)
-            if from_dict["attr1"] == "invalid":
-                message = f"Invalid setting value: attr1=[{from_dict['attr1']}]"
+            attr1 = from_dict["attr1"]
+            if attr1 == "invalid":
+                message = f"Invalid setting value: attr1=[{attr1}]"
                 raise ValueError(message)
-            attr1 = cast("str | None", from_dict.get("attr1", None))
+            assert isinstance(attr1, str)
             settings = DummyTTSSettings(attr1=attr1)
         return settings
 
@@ -168,7 +177,7 @@ def test_ittsplugin_get_display_name_should_accept_a_locale_argument() -> None:
 
 def test_ittsplugin_get_display_name_should_require_the_locale_argument() -> None:
     plugin = DummyTTSPlugin()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.get_display_name()  # type:ignore[call-arg]
 
 
@@ -217,7 +226,7 @@ def test_ittsplugin_make_settings_should_return_a_ittssettings_object() -> None:
     plugin = DummyTTSPlugin()
     settings = plugin.make_settings()
     _: ITTSSettings = settings  # Typecheck protocol conformity
-    assert isinstance(settings, ITTSSettings)  # Runtime check as well
+    assert isinstance(settings, DummyTTSSettings)  # Concrete runtime check
 
 
 def test_ittsplugin_make_settings_should_raise_an_error_if_an_invalid_key_given() -> (
@@ -241,7 +250,7 @@ def test_ittsplugin_make_settings_should_raise_an_error_if_an_invalid_value_give
 
 def test_ittsplugin_make_backend_should_require_a_settings_argument() -> None:
     plugin = DummyTTSPlugin()
-    with pytest.raises(TypeError, match=r"missing *. required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.make_backend()  # type:ignore[call-arg]
 
 
@@ -266,8 +275,8 @@ def test_ittsplugin_make_backend_should_raise_error_if_incorrect_settings_given(
     None
 ):
     plugin = DummyTTSPlugin()
-    settings = AnotherTTSSettings()
-    with pytest.raises(TypeError, match="Incorrect settings type"):
+    settings = ANOTHER_SETTINGS
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
         plugin.make_backend(settings)
 
 
@@ -301,10 +310,12 @@ def test_ittsplugin_get_settings_spec_result_should_be_immutable() -> None:
 ## .get_setting_display_name tests
 
 
-GET_SETTING_DISPLAY_NAME_ARGS: Final = {
-    "setting_name": "attr1",
-    "locale": "en_CA",
-}
+GET_SETTING_DISPLAY_NAME_ARGS: Final = MappingProxyType(
+    {
+        "setting_name": "attr1",
+        "locale": "en_CA",
+    }
+)
 
 
 def test_ittsplugin_get_setting_display_name_should_accept_required_arguments() -> None:
@@ -316,10 +327,13 @@ def test_ittsplugin_get_setting_display_name_should_accept_required_arguments()
 def test_ittsplugin_get_setting_display_name_should_require_required_arguments(
     argument: str,
 ) -> None:
-    args = GET_SETTING_DISPLAY_NAME_ARGS.copy()
-    del args[argument]
+    args = {
+        key: value
+        for key, value in GET_SETTING_DISPLAY_NAME_ARGS.items()
+        if key != argument
+    }
     plugin = DummyTTSPlugin()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.get_setting_display_name(**args)
 
 
@@ -349,10 +363,12 @@ def test_ittsplugin_get_setting_display_name_should_return_a_fallback_if_locale_
 ## .get_setting_description tests
 
 
-GET_SETTING_DESCRIPTION_ARGS: Final = {
-    "setting_name": "attr1",
-    "locale": "en_CA",
-}
+GET_SETTING_DESCRIPTION_ARGS: Final = MappingProxyType(
+    {
+        "setting_name": "attr1",
+        "locale": "en_CA",
+    }
+)
 
 
 def test_ittsplugin_get_setting_description_should_accept_required_arguments() -> None:
@@ -364,10 +380,13 @@ def test_ittsplugin_get_setting_description_should_accept_required_arguments() -
 def test_ittsplugin_get_setting_description_should_require_required_arguments(
     argument: str,
 ) -> None:
-    args = GET_SETTING_DESCRIPTION_ARGS.copy()
-    del args[argument]
+    args = {
+        key: value
+        for key, value in GET_SETTING_DESCRIPTION_ARGS.items()
+        if key != argument
+    }
     plugin = DummyTTSPlugin()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.get_setting_description(**args)
 
 
@@ -415,6 +434,9 @@ def test_ittsplugin_get_supported_locales_should_return_an_immutable_set() -> No
 ### TTSPluginRegistry Tests ###
 
 
+PLUGIN_NOT_FOUND_PATTERN: Final = re.compile("TTS plugin not found")
+
+
 class DummyNamespace:
     """Dummy namespace (fake module) for our dummy hook implementation."""
 
@@ -469,6 +491,16 @@ def configured_registry() -> tuple[TTSPluginRegistry, list[str]]:
     return registry, [plugin1.id, plugin2.id, plugin3.id]
 
 
+@pytest.fixture(scope="module")
+def empty_registry() -> TTSPluginRegistry:
+    """Return an empty TTSPluginRegistry shared across a module.
+
+    Only use this in tests that do not modify the registry.  E.g. Lookups that raise an
+    error before anything is changed.
+    """
+    return TTSPluginRegistry()
+
+
 ## .load_plugins tests
 
 # Based on: https://github.com/pytest-dev/pluggy/blob/main/testing/test_pluginmanager.py
@@ -546,7 +578,7 @@ def test_ttspluginregistry_load_plugins_should_let_hooks_be_skipped_by_returning
     monkeypatch.setattr(importlib.metadata, "distributions", dummy_distributions)
     registry = TTSPluginRegistry()
     registry.load_plugins(validate=False)
-    with pytest.raises(ValueError, match="TTS plugin not found"):
+    with pytest.raises(ValueError, match=PLUGIN_NOT_FOUND_PATTERN):
         registry.get_plugin("I should be skipped")
 
 
@@ -629,7 +661,7 @@ def test_ttspluginregistry_get_plugin_should_accept_an_id_argument() -> None:
 
 def test_ttspluginregistry_get_plugin_should_require_the_id_argument() -> None:
     registry = TTSPluginRegistry()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         registry.get_plugin()  # type:ignore[call-arg]
 
 
@@ -642,12 +674,11 @@ def test_ttspluginregistry_get_plugin_should_return_the_plugin_for_the_given_id(
     assert registry.get_plugin(plugin.id) is plugin
 
 
-def test_ttspluginregistry_get_plugin_should_raise_an_error_if_no_record_found() -> (
-    None
-):
-    registry = TTSPluginRegistry()
-    with pytest.raises(ValueError, match="TTS plugin not found"):
-        registry.get_plugin("non existent if")
+def test_ttspluginregistry_get_plugin_should_raise_an_error_if_no_record_found(
+    empty_registry: TTSPluginRegistry,
+) -> None:
+    with pytest.raises(ValueError, match=PLUGIN_NOT_FOUND_PATTERN):
+        empty_registry.get_plugin("non existent if")
 
 
 ## .is_enabled() tests
@@ -684,7 +715,7 @@ def test_ttspluginregistry_enable_should_accept_an_id_argument() -> None:
 
 def test_ttspluginregistry_enable_should_require_the_id_argument() -> None:
     registry = TTSPluginRegistry()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         registry.enable()  # type:ignore[call-arg]
 
 
@@ -705,12 +736,11 @@ def test_ttspluginregistry_enable_should_be_idempotent() -> None:
     assert registry.is_enabled(plugin.id)
 
 
-def test_ttspluginregistry_enable_should_raise_an_error_if_id_is_not_registered() -> (
-    None
-):
-    registry = TTSPluginRegistry()
-    with pytest.raises(ValueError, match="TTS plugin not found"):
-        registry.enable("non existent id")
+def test_ttspluginregistry_enable_should_raise_an_error_if_id_is_not_registered(
+    empty_registry: TTSPluginRegistry,
+) -> None:
+    with pytest.raises(ValueError, match=PLUGIN_NOT_FOUND_PATTERN):
+        empty_registry.enable("non existent id")
 
 
 def test_ttspluginregistry_enable_should_log_the_enablement(logot: Logot) -> None:
@@ -733,7 +763,7 @@ def test_ttspluginregistry_disable_should_accept_an_id_argument() -> None:
 
 def test_ttspluginregistry_disable_should_require_the_id_argument() -> None:
     registry = TTSPluginRegistry()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         registry.disable()  # type:ignore[call-arg]
 
 
@@ -756,12 +786,11 @@ def test_ttspluginregistry_disable_should_be_idempotent() -> None:
     assert not registry.is_enabled(plugin.id)
 
 
-def test_ttspluginregistry_disable_should_raise_an_error_if_id_is_not_registered() -> (
-    None
-):
-    registry = TTSPluginRegistry()
-    with pytest.raises(ValueError, match="TTS plugin not found"):
-        registry.disable("non existent id")
+def test_ttspluginregistry_disable_should_raise_an_error_if_id_is_not_registered(
+    empty_registry: TTSPluginRegistry,
+) -> None:
+    with pytest.raises(ValueError, match=PLUGIN_NOT_FOUND_PATTERN):
+        empty_registry.disable("non existent id")
 
 
 def test_ttspluginregistry_disable_should_log_the_disablement(logot: Logot) -> None:
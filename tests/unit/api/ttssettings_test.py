@@ -39,78 +39,50 @@ from aquarion.libs.libtts.api._ttssettings import (
     TTSSettingsSpecEntry,
     TTSSettingsSpecEntryTypes,
 )
+from tests.unit.api.conftest import (
+    ANOTHER_SETTINGS,
+    FROZEN_FIELD_PATTERN,
+    INCORRECT_SETTINGS_PATTERN,
+    MISSING_ARGUMENT_PATTERN,
+    MISSING_KEYWORD_ARGUMENT_PATTERN,
+    DummyTTSSettings,
+)
 
 ### ITTSSettings Tests ###
 
 
-class DummyTTSSettings:  # noqa: PLW1641
-    """Dummy ITTSSettings to test the protocol.
-
-    Specific implementations here do not matter, the only important thing is to conform
-    to the ITTSSettings protocol.
-    """
-
-    def __init__(self, attr1: str | None = None) -> None:
-        if attr1 is None:
-            attr1 = "default"
-        self.attr1 = attr1
-        self.locale = "en-CA"
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DummyTTSSettings):
-            # Since extension beyond the base protocol is not restricted, we are not
-            # testing the negative case.  Especially since this is just part of the
-            # normal __eq__() pattern.  Hence the no cover.
-            return NotImplemented  # pragma: no cover
-        return self.attr1 == other.attr1
-
-    def to_dict(self) -> dict[str, JSONSerializableTypes]:
-        return {"attr1": self.attr1}
-
-
-class AnotherTTSSettings:  # noqa: PLW1641
-    """NOT the DummyTTSSettings class."""
-
-    # These need to exist to conform to the ITTSSetting protocol, but are not actually
-    # used or needed for the tests.
-
-    locale = "fr-CA"
-
-    def __eq__(self, other: object) -> bool:
-        return False  # pragma: no cover
-
-    def to_dict(self) -> dict[str, JSONSerializableTypes]:
-        return {}  # pragma: no cover
+# Shared by tests that only read settings.  Tests that need a distinct or modified
+# instance must still create their own.
+DEFAULT_SETTINGS: Final = DummyTTSSettings()
 
 
 def test_ittssettings_should_conform_to_its_protocol() -> None:
-    settings = DummyTTSSettings()
+    settings = DEFAULT_SETTINGS
     _: ITTSSettings = settings  # Typecheck protocol conformity
     assert isinstance(settings, ITTSSettings)  # Runtime check as well
 
 
 def test_ittssettings_should_have_a_locale_attribute() -> None:
-    settings: ITTSSettings = DummyTTSSettings()
+    settings: ITTSSettings = DEFAULT_SETTINGS
     assert isinstance(settings.locale, str)
 
 
 def test_ittssettings_to_dict_should_return_a_dict_of_all_settings_as_base_types() -> (
     None
 ):
-    settings = DummyTTSSettings()
-    settings_dict: dict[str, JSONSerializableTypes] = settings.to_dict()
+    settings_dict: dict[str, JSONSerializableTypes] = DEFAULT_SETTINGS.to_dict()
     assert settings_dict["attr1"] == "default"
 
 
 def test_ittssettings_should_equate_if_setting_values_are_equal() -> None:
-    settings1 = DummyTTSSettings()
+    settings1 = DEFAULT_SETTINGS
     settings2 = DummyTTSSettings()
     assert settings1 == settings2
     assert settings1 is not settings2
 
 
 def test_ittssettings_should_not_equate_if_setting_values_are_different() -> None:
-    settings1 = DummyTTSSettings()
+    settings1 = DEFAULT_SETTINGS
     settings2 = DummyTTSSettings(attr1="not default")
     assert settings1 != settings2
     assert settings1 is not settings2
@@ -126,6 +98,8 @@ class DummyTTSSettingsHolder:
     to the ITTSSettingsHolder protocol.
     """
 
+    __slots__ = ("_settings",)
+
     def __init__(self) -> None:
         self._settings = DummyTTSSettings()
 
@@ -133,23 +107,26 @@ class DummyTTSSettingsHolder:
         return self._settings
 
     def update_settings(self, new_settings: ITTSSettings) -> None:
-        if not isinstance(new_settings, DummyTTSSettings):
+        if type(new_settings) is not DummyTTSSettings:
             message = f"Incorrect settings type: [{type(new_settings)}]."
             raise TypeError(message)
         self._settings = new_settings
 
 
+# Shared by tests that never change the holder's settings.
+DEFAULT_HOLDER: Final = DummyTTSSettingsHolder()
+
+
 def test_ittssettingsholder_should_conform_to_its_protocol() -> None:
-    holder = DummyTTSSettingsHolder()
+    holder = DEFAULT_HOLDER
     _: ITTSSettingsHolder = holder  # Typecheck protocol conformity
     assert isinstance(holder, ITTSSettingsHolder)  # Runtime check as well
 
 
 def test_ittssettingsholder_get_settings_should_return_an_ittssettings() -> None:
-    holder = DummyTTSSettingsHolder()
-    settings = holder.get_settings()
+    settings = DEFAULT_HOLDER.get_settings()
     _: ITTSSettings = settings  # Typecheck protocol conformity
-    assert isinstance(settings, ITTSSettings)  # Runtime check as well
+    assert isinstance(settings, DummyTTSSettings)  # Concrete runtime check
 
 
 def test_ittssettingsholder_update_settings_should_accept_a_settings_argument() -> None:
@@ -160,9 +137,8 @@ def test_ittssettingsholder_update_settings_should_accept_a_settings_argument()
 def test_ittssettingsholder_update_settings_should_require_the_settings_argument() -> (
     None
 ):
-    holder = DummyTTSSettingsHolder()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
-        holder.update_settings()  # type:ignore[call-arg]
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
+        DEFAULT_HOLDER.update_settings()  # type:ignore[call-arg]
 
 
 def test_ittssettingsholder_update_settings_should_not_return_anything() -> None:
@@ -185,10 +161,8 @@ def test_ittssettingsholder_update_settings_should_update_the_settings() -> None
 def test_ittssettingsholder_update_settings_should_raise_error_if_incorrect_type() -> (
     None
 ):
-    holder = DummyTTSSettingsHolder()
-    incorrect_settings = AnotherTTSSettings()
-    with pytest.raises(TypeError, match="Incorrect settings type"):
-        holder.update_settings(incorrect_settings)
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
+        DEFAULT_HOLDER.update_settings(ANOTHER_SETTINGS)
 
 
 ### TTSSettingsSpecEntry tests ###
@@ -211,14 +185,24 @@ SPEC_ENTRY_ARGS: Final[SpecEntryArgsType[int]] = {
 }
 
 
+def make_spec_entry() -> TTSSettingsSpecEntry[int]:
+    """Return a TTSSettingsSpecEntry made from SPEC_ENTRY_ARGS as explicit keywords."""
+    return TTSSettingsSpecEntry[int](
+        type=SPEC_ENTRY_ARGS["type"],
+        min=SPEC_ENTRY_ARGS["min"],
+        max=SPEC_ENTRY_ARGS["max"],
+        values=SPEC_ENTRY_ARGS["values"],
+    )
+
+
 def test_ttssettingsspecentry_should_accept_expected_arguments() -> None:
-    TTSSettingsSpecEntry[int](**SPEC_ENTRY_ARGS)
+    make_spec_entry()
 
 
 def test_ttssettingsspecentry_should_require_the_type_argument() -> None:
     args = SPEC_ENTRY_ARGS.copy()
     del args["type"]  # type:ignore[misc]
-    with pytest.raises(TypeError, match=r"missing .* required keyword-only argument"):
+    with pytest.raises(TypeError, match=MISSING_KEYWORD_ARGUMENT_PATTERN):
         TTSSettingsSpecEntry[int](**args)
 
 
@@ -231,6 +215,6 @@ def test_ttssettingsspecentry_should_accept_only_keyword_arguments() -> None:
 
 @pytest.mark.parametrize("attribute", SPEC_ENTRY_ARGS.keys())
 def test_ttssettingsspecentry_should_be_immutable(attribute: str) -> None:
-    entry = TTSSettingsSpecEntry[int](**SPEC_ENTRY_ARGS)
-    with pytest.raises(FrozenInstanceError, match="cannot assign to field"):
+    entry = make_spec_entry()
+    with pytest.raises(FrozenInstanceError, match=FROZEN_FIELD_PATTERN):
         setattr(entry, attribute, SPEC_ENTRY_ARGS[attribute])  # type:ignore[literal-required,misc]
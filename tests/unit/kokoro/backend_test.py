@@ -22,6 +22,7 @@ from __future__ import annotations
 from os import environ
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock
 
 import pytest
 import torch
@@ -35,12 +36,18 @@ from aquarion.libs.libtts.api import (
 )
 from aquarion.libs.libtts.kokoro._backend import _TEXT_IN_LOG_MAX_LEN, KokoroBackend
 from aquarion.libs.libtts.kokoro.settings import KokoroSettings, KokoroVoices
-from tests.unit.api.ttssettings_test import AnotherTTSSettings
+from tests.unit.api.conftest import (
+    ANOTHER_SETTINGS,
+    INCORRECT_SETTINGS_PATTERN,
+    MISSING_ARGUMENT_PATTERN,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pytest_mock import MockerFixture
 
-    from tests.unit.kokoro.conftest import SettingsDict
+    from tests.unit.kokoro.conftest import SettingsPathDict
 
 EXPECTED_AUDIO_SPEC = (
     "TTSAudioSpec(mime_type='audio/L16;rate=24000;channels=1', sample_rate=24000,"
@@ -49,52 +56,80 @@ EXPECTED_AUDIO_SPEC = (
 )
 
 
-@pytest.fixture(autouse=True)
-def mock_kpipeline(mocker: MockerFixture) -> None:
+@pytest.fixture(scope="module")
+def kpipeline_results() -> tuple[KPipeline.Result, ...]:
+    """Return fake KPipeline results shared across a module.
+
+    KokoroBackend only reads the audio from these, so they can be built once.
+    """
+    audio_result: KPipeline.Result = MagicMock(spec_set=KPipeline.Result)
+    audio_result.audio = cast("torch.FloatTensor", torch.zeros(1, 2))  # type:ignore[misc]
+    no_audio_result: KPipeline.Result = MagicMock(spec_set=KPipeline.Result)
+    no_audio_result.audio = None  # type:ignore[misc]
+    return (no_audio_result, audio_result)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_kpipeline(kpipeline_results: tuple[KPipeline.Result, ...]) -> Iterator[None]:
+    """Replace the parts of KPipeline that KokoroBackend uses, for a whole module.
+
+    Tests only ever call these stand-ins, so they are patched in once and undone after
+    the module's last test.  Tests that need to inspect calls should patch on their own.
+    """
     # If this environment variable is set, do not mock anything.  This is only for
     # debugging tests.  Use acceptance tests to test the actual Kokoro backend.
     if environ.get("KOKORO_TEST_SKIP_MOCK", "0") == "1":  # pragma: no cover
+        yield
         return
-    mock_audio_result: KPipeline.Result = mocker.MagicMock(spec_set=KPipeline.Result)
-    mock_audio_result.audio = cast("torch.FloatTensor", torch.zeros(1, 2))  # type:ignore[misc]
-    mock_no_audio_result: KPipeline.Result = mocker.MagicMock(spec_set=KPipeline.Result)
-    mock_no_audio_result.audio = None  # type:ignore[misc]
-    call_return_value: list[KPipeline.Result] = [
-        mock_no_audio_result,
-        mock_audio_result,
-    ]
-    mocker.patch.object(KPipeline, "__init__", return_value=None)
-    mocker.patch.object(KPipeline, "load_voice", return_value=None)
-    mocker.patch.object(KPipeline, "__call__", return_value=call_return_value)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(KPipeline, "__init__", MagicMock(return_value=None))
+        monkeypatch.setattr(KPipeline, "load_voice", MagicMock(return_value=None))
+        monkeypatch.setattr(
+            KPipeline, "__call__", MagicMock(return_value=kpipeline_results)
+        )
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_backend(default_settings: KokoroSettings) -> KokoroBackend:
+    """Return a KokoroBackend with default settings shared across a module.
+
+    Only use this in tests that do not start the backend or change its settings.
+    """
+    return KokoroBackend(default_settings)
 
 
 ### KokoroBackend Tests ###
 
 
-def test_kokorobackend_should_accept_a_settings_argument() -> None:
-    KokoroBackend(settings=KokoroSettings())
+def test_kokorobackend_should_accept_a_settings_argument(
+    default_settings: KokoroSettings,
+) -> None:
+    KokoroBackend(settings=default_settings)
 
 
-def test_kokorobackend_should_accept_settings_as_a_positional_argument() -> None:
-    KokoroBackend(KokoroSettings())
+def test_kokorobackend_should_accept_settings_as_a_positional_argument(
+    default_settings: KokoroSettings,
+) -> None:
+    KokoroBackend(default_settings)
 
 
 def test_kokorobackend_should_require_the_settings_argument() -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         KokoroBackend()  # type:ignore[call-arg]
 
 
 def test_kokorobackend_should_require_settings_to_be_instance_of_kokorosettings() -> (
     None
 ):
-    with pytest.raises(TypeError, match="Incorrect settings type"):
-        KokoroBackend(settings=AnotherTTSSettings)  # type:ignore[arg-type]
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
+        KokoroBackend(settings=ANOTHER_SETTINGS)
 
 
 def test_kokorobackend_should_use_local_model_path_when_given(
-    real_settings_path_args: SettingsDict, mocker: MockerFixture
+    real_settings_path_args: SettingsPathDict, mocker: MockerFixture
 ) -> None:
-    expected = Path(cast("str", real_settings_path_args["model_path"]))
+    expected = Path(real_settings_path_args["model_path"])
     mock_kmodel = mocker.patch("aquarion.libs.libtts.kokoro._backend.KModel")
     backend = KokoroBackend(KokoroSettings(model_path=expected))
     backend.start()
@@ -103,9 +138,9 @@ def test_kokorobackend_should_use_local_model_path_when_given(
 
 
 def test_kokorobackend_should_use_local_config_path_when_given(
-    real_settings_path_args: SettingsDict, mocker: MockerFixture
+    real_settings_path_args: SettingsPathDict, mocker: MockerFixture
 ) -> None:
-    expected = Path(cast("str", real_settings_path_args["config_path"]))
+    expected = Path(real_settings_path_args["config_path"])
     mock_kmodel = mocker.patch("aquarion.libs.libtts.kokoro._backend.KModel")
     backend = KokoroBackend(KokoroSettings(config_path=expected))
     backend.start()
@@ -114,9 +149,9 @@ def test_kokorobackend_should_use_local_config_path_when_given(
 
 
 def test_kokorobackend_should_use_local_voice_path_when_given(
-    real_settings_path_args: SettingsDict, mocker: MockerFixture
+    real_settings_path_args: SettingsPathDict, mocker: MockerFixture
 ) -> None:
-    expected = Path(cast("str", real_settings_path_args["voice_path"]))
+    expected = Path(real_settings_path_args["voice_path"])
     mock_kpipeline = mocker.patch("aquarion.libs.libtts.kokoro._backend.KPipeline")
     backend = KokoroBackend(KokoroSettings(voice_path=expected))
     backend.start()
@@ -124,36 +159,46 @@ def test_kokorobackend_should_use_local_voice_path_when_given(
     assert mock_kpipeline.return_value.load_voice.call_args.args[0] == str(expected)  # type:ignore[misc]
 
 
-def test_kokorobackend_should_log_its_initialization(logot: Logot) -> None:
-    KokoroBackend(KokoroSettings())
+def test_kokorobackend_should_log_its_initialization(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
+    KokoroBackend(default_settings)
     logot.assert_logged(logged.debug("Kokoro TTS Backend initialized."))
 
 
-def test_kokorobackend_update_settings_should_log_its_action(logot: Logot) -> None:
-    backend = KokoroBackend(KokoroSettings())
-    backend.update_settings(KokoroSettings())
+def test_kokorobackend_update_settings_should_log_its_action(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
+    backend = KokoroBackend(default_settings)
+    backend.update_settings(default_settings)
     logot.assert_logged(logged.debug("Kokoro TTS backend settings updated."))
 
 
-def test_kokorobackend_convert_should_log_its_action(logot: Logot) -> None:
+def test_kokorobackend_convert_should_log_its_action(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
     text = "some text"
-    backend = KokoroBackend(KokoroSettings())
+    backend = KokoroBackend(default_settings)
     backend.start()
     list(backend.convert(text))
     logot.assert_logged(logged.debug(f"Kokoro TTS backend converting text: {text}"))
 
 
-def test_kokorobackend_convert_should_truncate_long_text_in_log(logot: Logot) -> None:
+def test_kokorobackend_convert_should_truncate_long_text_in_log(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
     long_text = "123456789_" * 20  # len(str) == 10, 10 * 20 == 200, 200 > max log len
     expected = f"{long_text[:_TEXT_IN_LOG_MAX_LEN]}..."
-    backend = KokoroBackend(KokoroSettings())
+    backend = KokoroBackend(default_settings)
     backend.start()
     list(backend.convert(long_text))
     logot.assert_logged(logged.debug(f"Kokoro TTS backend converting text: {expected}"))
 
 
-def test_kokorobackend_start_should_log_its_actions(logot: Logot) -> None:
-    settings = KokoroSettings()
+def test_kokorobackend_start_should_log_its_actions(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
+    settings = default_settings
     backend = KokoroBackend(settings)
     backend.start()
     logot.assert_logged(
@@ -164,9 +209,10 @@ def test_kokorobackend_start_should_log_its_actions(logot: Logot) -> None:
     )
 
 
-def test_kokorobackend_stop_should_log_its_action(logot: Logot) -> None:
-    backend = KokoroBackend(KokoroSettings())
-    backend.start()
+def test_kokorobackend_stop_should_log_its_action(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.stop()
     logot.assert_logged(logged.debug("Kokoro TTS backend stopped."))
 
@@ -174,52 +220,61 @@ def test_kokorobackend_stop_should_log_its_action(logot: Logot) -> None:
 ## ITTSBackend Protocol Conformity ##
 
 
-def test_kokorobackend_should_conform_to_the_ittsbackend_protocol() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    _: ITTSBackend = backend  # Typecheck protocol conformity
-    assert isinstance(backend, ITTSBackend)  # Runtime check as well
+def test_kokorobackend_should_conform_to_the_ittsbackend_protocol(
+    default_backend: KokoroBackend,
+) -> None:
+    _: ITTSBackend = default_backend  # Typecheck protocol conformity
+    assert isinstance(default_backend, ITTSBackend)  # Runtime check as well
 
 
-def test_kokorobackend_should_be_stopped_by_default() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_should_be_stopped_by_default(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     assert not backend.is_started
 
 
 ## .get_settings tests
 
 
-def test_kokorobackend_get_settings_should_return_an_ittssettings() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    settings = backend.get_settings()
+def test_kokorobackend_get_settings_should_return_an_ittssettings(
+    default_backend: KokoroBackend,
+) -> None:
+    settings = default_backend.get_settings()
     _: ITTSSettings = settings  # Typecheck protocol conformity
-    assert isinstance(settings, ITTSSettings)  # Runtime check as well
+    assert isinstance(settings, KokoroSettings)  # Concrete runtime check
 
 
 ## .update_settings tests
 
 
-def test_kokorobackend_update_settings_should_accept_a_settings_argument() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    backend.update_settings(KokoroSettings())
+def test_kokorobackend_update_settings_should_accept_a_settings_argument(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
+    backend.update_settings(default_settings)
 
 
-def test_kokorobackend_update_settings_should_require_the_settings_argument() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
-        backend.update_settings()  # type:ignore[call-arg]
+def test_kokorobackend_update_settings_should_require_the_settings_argument(
+    default_backend: KokoroBackend,
+) -> None:
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
+        default_backend.update_settings()  # type:ignore[call-arg]
 
 
-def test_kokorobackend_update_settings_should_not_return_anything() -> None:
+def test_kokorobackend_update_settings_should_not_return_anything(
+    default_settings: KokoroSettings,
+) -> None:
     # CQS principle: Commands should not return anything.
-    backend = KokoroBackend(KokoroSettings())
-    result: None = backend.update_settings(KokoroSettings())  # type:ignore[func-returns-value]
+    backend = KokoroBackend(default_settings)
+    result: None = backend.update_settings(default_settings)  # type:ignore[func-returns-value]
     assert result is None
 
 
-def test_kokorobackend_update_settings_should_update_settings_when_not_started() -> (
-    None
-):
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_update_settings_should_update_settings_when_not_started(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     orig_settings = backend.get_settings()
     new_settings = KokoroSettings(locale="en-GB", voice=KokoroVoices.bf_emma)
     backend.stop()  # Default is stopped, this is just to make sure.
@@ -230,9 +285,9 @@ def test_kokorobackend_update_settings_should_update_settings_when_not_started()
 
 
 def test_kokorobackend_update_settings_should_update_settings_when_already_started(
-    # This is here to force Ruff to wrap line.
+    default_settings: KokoroSettings,
 ) -> None:
-    backend = KokoroBackend(KokoroSettings())
+    backend = KokoroBackend(default_settings)
     orig_settings = backend.get_settings()
     new_settings = KokoroSettings(locale="en-GB", voice=KokoroVoices.bf_emma)
     backend.start()
@@ -242,44 +297,48 @@ def test_kokorobackend_update_settings_should_update_settings_when_already_start
     assert updated_settings != orig_settings
 
 
-def test_kokorobackend_update_settings_should_raise_error_if_incorrect_kind() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    incorrect_settings = AnotherTTSSettings()
-    with pytest.raises(TypeError, match="Incorrect settings type"):
-        backend.update_settings(incorrect_settings)
+def test_kokorobackend_update_settings_should_raise_error_if_incorrect_kind(
+    default_backend: KokoroBackend,
+) -> None:
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
+        default_backend.update_settings(ANOTHER_SETTINGS)
 
 
 ## .audio_spec tests
 
 
-def test_kokorobackend_should_have_an_audio_spec_property() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    assert hasattr(backend, "audio_spec")
+def test_kokorobackend_should_have_an_audio_spec_property(
+    default_backend: KokoroBackend,
+) -> None:
+    assert hasattr(default_backend, "audio_spec")
 
 
-def test_kokorobackend_audio_spec_should_return_a_ttsaudiospec_instance() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    assert isinstance(backend.audio_spec, TTSAudioSpec)
+def test_kokorobackend_audio_spec_should_return_a_ttsaudiospec_instance(
+    default_backend: KokoroBackend,
+) -> None:
+    assert isinstance(default_backend.audio_spec, TTSAudioSpec)
 
 
-def test_kokorobackend_audio_spec_should_indicate_audio_l16_format() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    assert str(backend.audio_spec) == EXPECTED_AUDIO_SPEC
+def test_kokorobackend_audio_spec_should_indicate_audio_l16_format(
+    default_backend: KokoroBackend,
+) -> None:
+    assert str(default_backend.audio_spec) == EXPECTED_AUDIO_SPEC
 
 
 ## .convert() tests
 
 
-def test_kokorobackend_convert_should_require_some_text_input() -> None:
-    backend = KokoroBackend(KokoroSettings())
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
-        backend.convert()  # type:ignore[call-arg]
+def test_kokorobackend_convert_should_require_some_text_input(
+    default_backend: KokoroBackend,
+) -> None:
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
+        default_backend.convert()  # type:ignore[call-arg]
 
 
-def test_kokorobackend_convert_should_return_a_generator_of_chunks_of_audio_bytes() -> (
-    None
-):
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_convert_should_return_a_generator_of_chunks_of_audio_bytes(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     audio_bytes = b"".join(list(backend.convert("some text")))
     assert len(audio_bytes) > 0
@@ -289,8 +348,10 @@ def test_kokorobackend_convert_should_return_a_generator_of_chunks_of_audio_byte
     assert audio_bytes == b"\x00\x00\x00\x00"
 
 
-def test_kokorobackend_convert_should_raise_an_error_if_backend_not_started() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_convert_should_raise_an_error_if_backend_not_started(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     with pytest.raises(RuntimeError, match="Backend is not started"):
         list(backend.convert("some text"))
 
@@ -298,45 +359,56 @@ def test_kokorobackend_convert_should_raise_an_error_if_backend_not_started() ->
 ## .is_started tests
 
 
-def test_kokorobackend_is_started_should_return_true_if_started() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_is_started_should_return_true_if_started(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     assert backend.is_started
 
 
-def test_kokorobackend_is_started_should_return_false_if_stopped() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_is_started_should_return_false_if_stopped(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     backend.stop()
     assert not backend.is_started
 
 
-def test_kokorobackend_is_started_should_be_read_only() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_is_started_should_be_read_only(
+    default_backend: KokoroBackend,
+) -> None:
     with pytest.raises(AttributeError, match=r"property .* of .* object has no setter"):
-        backend.is_started = True  # type:ignore[misc]
+        default_backend.is_started = True  # type:ignore[misc]
 
 
 ## .start() tests
 
 
-def test_kokorobackend_start_should_start_the_backend() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_start_should_start_the_backend(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     assert backend.is_started
 
 
-def test_kokorobackend_start_should_be_idempotent() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_start_should_be_idempotent(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     assert backend.is_started
     backend.start()
     assert backend.is_started
 
 
-def test_kokorobackend_start_should_not_return_anything() -> None:
+def test_kokorobackend_start_should_not_return_anything(
+    default_settings: KokoroSettings,
+) -> None:
     # CQS principle: Commands should not return anything.
-    backend = KokoroBackend(KokoroSettings())
+    backend = KokoroBackend(default_settings)
     result: None = backend.start()  # type:ignore[func-returns-value]
     assert result is None
 
@@ -344,16 +416,20 @@ def test_kokorobackend_start_should_not_return_anything() -> None:
 ## .stop() tests
 
 
-def test_kokorobackend_stop_should_stop_the_backend() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_stop_should_stop_the_backend(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     assert backend.is_started
     backend.stop()
     assert not backend.is_started
 
 
-def test_kokorobackend_stop_should_be_idempotent() -> None:
-    backend = KokoroBackend(KokoroSettings())
+def test_kokorobackend_stop_should_be_idempotent(
+    default_settings: KokoroSettings,
+) -> None:
+    backend = KokoroBackend(default_settings)
     backend.start()
     assert backend.is_started
     backend.stop()
@@ -362,8 +438,10 @@ def test_kokorobackend_stop_should_be_idempotent() -> None:
     assert not backend.is_started
 
 
-def test_kokorobackend_stop_should_not_return_anything() -> None:
+def test_kokorobackend_stop_should_not_return_anything(
+    default_settings: KokoroSettings,
+) -> None:
     # CQS principle: Commands should not return anything.
-    backend = KokoroBackend(KokoroSettings())
+    backend = KokoroBackend(default_settings)
     result: None = backend.stop()  # type:ignore[func-returns-value]
     assert result is None
@@ -19,10 +19,13 @@
 
 from __future__ import annotations
 
-from typing import Final, TypedDict, cast
+import re
+from typing import Final, TypedDict
 
 import pytest
 
+from aquarion.libs.libtts.kokoro.settings import KokoroSettings
+
 
 class SettingsDict(TypedDict, total=False):
     """Types for KokoroSettings dicts and arguments."""
@@ -37,6 +40,14 @@ class SettingsDict(TypedDict, total=False):
     voice_path: str | None
 
 
+class SettingsPathDict(TypedDict):
+    """Types for KokoroSettings path arguments that point to files that exist."""
+
+    model_path: str
+    config_path: str
+    voice_path: str
+
+
 SETTINGS_ARGS: Final[SettingsDict] = {
     "locale": "en_GB",
     "voice": "bf_emma",
@@ -47,26 +58,69 @@ SETTINGS_ARGS: Final[SettingsDict] = {
     "config_path": "config.json",
     "voice_path": "af_heart.pt",
 }
-
-
-INVALID_SETTINGS_CASES: Final = [
-    ("locale", "xx-XX", "Invalid locale"),
-    ("locale", "es", "Unsupported locale"),
-    ("locale", "hi", "Unsupported locale"),
-    ("locale", "it", "Unsupported locale"),
-    ("locale", "pt-br", "Unsupported locale"),
-    ("locale", "ja", "Unsupported locale"),
-    ("locale", "zh", "Unsupported locale"),
-    ("voice", "xf_not_exist", "Input should be 'af_heart'"),
-    ("voice", "ff_siwis", "Invalid voice for the locale: en_US"),
-    ("speed", -1, "Input should be greater than or equal to 0.1"),
-    ("speed", 0, "Input should be greater than or equal to 0.1"),
-    ("speed", 2.1, "less than or equal to 2"),
-    ("device", "bad_device", "Input should be 'cpu'"),
-    ("model_path", "bad/exist", "Path does not point to a file"),
-    ("config_path", "bad/exist", "Path does not point to a file"),
-    ("voice_path", "bad/exist", "Path does not point to a file"),
-]
+# Taken from SettingsPathDict so these match the keys of real_settings_path_args.
+PATH_SETTING_NAMES: Final = tuple(sorted(SettingsPathDict.__required_keys__))
+
+
+INVALID_SETTINGS_CASES: Final = (
+    pytest.param("locale", "xx-XX", re.compile("Invalid locale"), id="locale-invalid"),
+    pytest.param("locale", "es", re.compile("Unsupported locale"), id="locale-es"),
+    pytest.param("locale", "hi", re.compile("Unsupported locale"), id="locale-hi"),
+    pytest.param("locale", "it", re.compile("Unsupported locale"), id="locale-it"),
+    pytest.param(
+        "locale", "pt-br", re.compile("Unsupported locale"), id="locale-pt-br"
+    ),
+    pytest.param("locale", "ja", re.compile("Unsupported locale"), id="locale-ja"),
+    pytest.param("locale", "zh", re.compile("Unsupported locale"), id="locale-zh"),
+    pytest.param(
+        "voice",
+        "xf_not_exist",
+        re.compile("Input should be 'af_heart'"),
+        id="voice-invalid",
+    ),
+    pytest.param(
+        "voice",
+        "ff_siwis",
+        re.compile("Invalid voice for the locale: en_US"),
+        id="voice-wrong-locale",
+    ),
+    pytest.param(
+        "speed",
+        -1,
+        re.compile("Input should be greater than or equal to 0.1"),
+        id="speed-negative",
+    ),
+    pytest.param(
+        "speed",
+        0,
+        re.compile("Input should be greater than or equal to 0.1"),
+        id="speed-zero",
+    ),
+    pytest.param(
+        "speed", 2.1, re.compile("less than or equal to 2"), id="speed-too-fast"
+    ),
+    pytest.param(
+        "device", "bad_device", re.compile("Input should be 'cpu'"), id="device-invalid"
+    ),
+    pytest.param(
+        "model_path",
+        "bad/exist",
+        re.compile("Path does not point to a file"),
+        id="model_path-missing",
+    ),
+    pytest.param(
+        "config_path",
+        "bad/exist",
+        re.compile("Path does not point to a file"),
+        id="config_path-missing",
+    ),
+    pytest.param(
+        "voice_path",
+        "bad/exist",
+        re.compile("Path does not point to a file"),
+        id="voice_path-missing",
+    ),
+)
 
 
 EXPECTED_SETTING_DESCRIPTIONS = {
@@ -149,13 +203,36 @@ for setting_name in EXPECTED_SETTING_DESCRIPTIONS:  # noqa: PLC0206
 @pytest.fixture(scope="session")
 def real_settings_path_args(
     tmp_path_factory: pytest.TempPathFactory,
-) -> SettingsDict:
+) -> SettingsPathDict:
     tmp_dir_path = tmp_path_factory.mktemp("kokoro_data")
-    path_args = {}
-    for argument, file_name in SETTINGS_ARGS.items():
-        if not argument.endswith("_path"):
-            continue
-        file_path = tmp_dir_path / cast("str", file_name)
+
+    def touch(file_name: str | None) -> str:
+        assert file_name is not None
+        file_path = tmp_dir_path / file_name
         file_path.touch()
-        path_args[argument] = str(file_path)
-    return cast("SettingsDict", path_args)
+        return str(file_path)
+
+    return {
+        "model_path": touch(SETTINGS_ARGS["model_path"]),
+        "config_path": touch(SETTINGS_ARGS["config_path"]),
+        "voice_path": touch(SETTINGS_ARGS["voice_path"]),
+    }
+
+
+@pytest.fixture(scope="session")
+def real_settings_args(real_settings_path_args: SettingsPathDict) -> SettingsDict:
+    """Return SETTINGS_ARGS with paths to files that exist.
+
+    This is shared across the session, so do not modify it.
+    """
+    return {**SETTINGS_ARGS, **real_settings_path_args}
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> KokoroSettings:
+    """Return default KokoroSettings shared across the session.
+
+    KokoroSettings is frozen, so tests that only read the defaults, or only hand them
+    to a backend, can share this one instance.
+    """
+    return KokoroSettings()
@@ -22,7 +22,6 @@ from __future__ import annotations
 import sys
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Final
-from unittest.mock import patch
 
 import pytest
 from logot import Logot, logged
@@ -39,11 +38,12 @@ KOKORO_DEPENDENCIES: Final = ["torch", "kokoro"]
 
 @contextmanager
 def disable_dependency(module: str) -> Generator[None, None, None]:
-    backup = sys.modules[module]
-    del sys.modules[module]
-    with patch("sys.path", []):
+    # Only hide the module inside the with block.  Other plugins' hooks, e.g.
+    # pytest-randomly reseeding torch through thinc, still need to import it.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.delitem(sys.modules, module)
+        monkeypatch.setattr(sys, "path", [])
         yield
-    sys.modules[module] = backup
 
 
 ### register_tts_plugin() tests ###
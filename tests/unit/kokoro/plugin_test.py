@@ -21,7 +21,8 @@ from __future__ import annotations
 
 from collections.abc import Mapping, MutableSet
 from collections.abc import Set as AbstractSet
-from typing import Final, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, cast
 
 import pytest
 from logot import Logot, logged
@@ -35,7 +36,11 @@ from aquarion.libs.libtts.api import (
 )
 from aquarion.libs.libtts.kokoro._plugin import KokoroPlugin
 from aquarion.libs.libtts.kokoro.settings import KokoroLocales, KokoroSettings
-from tests.unit.api.ttssettings_test import AnotherTTSSettings
+from tests.unit.api.conftest import (
+    ANOTHER_SETTINGS,
+    INCORRECT_SETTINGS_PATTERN,
+    MISSING_ARGUMENT_PATTERN,
+)
 from tests.unit.kokoro.conftest import (
     EXPECTED_SETTING_DESCRIPTIONS,
     INVALID_SETTINGS_CASES,
@@ -43,6 +48,15 @@ from tests.unit.kokoro.conftest import (
     SettingsDict,
 )
 
+if TYPE_CHECKING:
+    import re
+
+# The declared field defaults, looked up once rather than per parametrized test.
+DEFAULT_VALUES: Final[dict[str, object]] = {
+    name: KokoroSettings.__pydantic_fields__[name].default  # type:ignore[attr-defined,misc]
+    for name in SETTINGS_ARGS
+}
+
 ### KokoroPlugin Tests ###
 
 
@@ -52,9 +66,11 @@ def test_kokoroplugin_make_settings_should_log_settings_creation(logot: Logot) -
     logot.assert_logged(logged.debug(f"Created new KokoroSettings: {settings!s}"))
 
 
-def test_kokoroplugin_make_backend_should_log_backend_creation(logot: Logot) -> None:
+def test_kokoroplugin_make_backend_should_log_backend_creation(
+    logot: Logot, default_settings: KokoroSettings
+) -> None:
     plugin = KokoroPlugin()
-    plugin.make_backend(plugin.make_settings())
+    plugin.make_backend(default_settings)
     logot.assert_logged(logged.debug("Created new KokoroBackend."))
 
 
@@ -93,7 +109,7 @@ def test_kokoroplugin_get_display_name_should_accept_a_locale_argument() -> None
 
 def test_kokoroplugin_get_display_name_should_require_the_locale_argument() -> None:
     plugin = KokoroPlugin()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.get_display_name()  # type:ignore[call-arg]
 
 
@@ -130,33 +146,26 @@ def test_kokoroplugin_make_settings_should_use_default_values_when_no_values_giv
 ) -> None:
     plugin = KokoroPlugin()
     settings = plugin.make_settings()
-    assert isinstance(settings, KokoroSettings)  # For the type checker
-    assert (
-        getattr(settings, attribute)  # type:ignore[misc]
-        == settings.__pydantic_fields__[attribute].default  # type:ignore[attr-defined,misc]
-    )
+    assert getattr(settings, attribute) == DEFAULT_VALUES[attribute]  # type:ignore[misc]
 
 
 @pytest.mark.parametrize(("attribute"), SETTINGS_ARGS)
 def test_kokoroplugin_make_settings_should_use_given_values_when_values_are_given(
-    real_settings_path_args: SettingsDict, attribute: str
+    real_settings_args: SettingsDict, attribute: str
 ) -> None:
-    expected_dict = SETTINGS_ARGS.copy()
-    expected_dict.update(real_settings_path_args)
     plugin = KokoroPlugin()
     settings = plugin.make_settings(
-        from_dict=cast("Mapping[str, JSONSerializableTypes]", expected_dict)
+        from_dict=cast("Mapping[str, JSONSerializableTypes]", real_settings_args)
     )
-    assert isinstance(settings, KokoroSettings)  # For the type checker
-    settings_dict = cast("SettingsDict", settings.to_dict())
-    assert settings_dict.get(attribute) == expected_dict.get(attribute)
+    settings_dict = settings.to_dict()
+    assert settings_dict.get(attribute) == real_settings_args.get(attribute)
 
 
 def test_kokoroplugin_make_settings_should_return_a_ittssettings_object() -> None:
     plugin = KokoroPlugin()
     settings = plugin.make_settings()
     _: ITTSSettings = settings  # Typecheck protocol conformity
-    assert isinstance(settings, ITTSSettings)  # Runtime check as well
+    assert isinstance(settings, KokoroSettings)  # Concrete runtime check
 
 
 def test_kokoroplugin_make_settings_should_raise_an_error_if_an_invalid_key_given(
@@ -171,7 +180,7 @@ def test_kokoroplugin_make_settings_should_raise_an_error_if_an_invalid_key_give
 def test_kokoroplugin_make_settings_should_raise_an_error_if_an_invalid_value_given(
     attr: str,
     value: JSONSerializableTypes,
-    err_msg: str,
+    err_msg: re.Pattern[str],
 ) -> None:
     plugin = KokoroPlugin()
     with pytest.raises(ValueError, match=err_msg):
@@ -183,23 +192,25 @@ def test_kokoroplugin_make_settings_should_raise_an_error_if_an_invalid_value_gi
 
 def test_kokoroplugin_make_backend_should_require_a_settings_argument() -> None:
     plugin = KokoroPlugin()
-    with pytest.raises(TypeError, match=r"missing *. required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.make_backend()  # type:ignore[call-arg]
 
 
-def test_kokoroplugin_make_backend_should_use_the_given_settings() -> None:
+def test_kokoroplugin_make_backend_should_use_the_given_settings(
+    default_settings: KokoroSettings,
+) -> None:
     plugin = KokoroPlugin()
-    expected_settings = plugin.make_settings()
+    expected_settings = default_settings
     backend = plugin.make_backend(expected_settings)
     settings = backend.get_settings()
-    assert isinstance(settings, KokoroSettings)  # For the type checker
     assert settings == expected_settings
 
 
-def test_kokoroplugin_make_backend_should_return_a_ittsbackend_object() -> None:
+def test_kokoroplugin_make_backend_should_return_a_ittsbackend_object(
+    default_settings: KokoroSettings,
+) -> None:
     plugin = KokoroPlugin()
-    settings = plugin.make_settings()
-    backend = plugin.make_backend(settings)
+    backend = plugin.make_backend(default_settings)
     _: ITTSBackend = backend  # Typecheck protocol conformity
     assert isinstance(backend, ITTSBackend)  # Runtime check as well
 
@@ -208,8 +219,8 @@ def test_kokoroplugin_make_backend_should_raise_error_if_incorrect_settings_give
     # Force line wrap in Ruff.
 ) -> None:
     plugin = KokoroPlugin()
-    settings = AnotherTTSSettings()
-    with pytest.raises(TypeError, match="Incorrect settings type"):
+    settings = ANOTHER_SETTINGS
+    with pytest.raises(TypeError, match=INCORRECT_SETTINGS_PATTERN):
         plugin.make_backend(settings)
 
 
@@ -243,10 +254,12 @@ def test_kokoroplugin_get_settings_spec_result_should_be_immutable() -> None:
 ## .get_setting_display_name tests
 
 
-GET_SETTING_DISPLAY_NAME_ARGS: Final = {
-    "setting_name": "locale",
-    "locale": "en_CA",
-}
+GET_SETTING_DISPLAY_NAME_ARGS: Final = MappingProxyType(
+    {
+        "setting_name": "locale",
+        "locale": "en_CA",
+    }
+)
 EXPECTED_SETTING_DISPLAY_NAMES = {
     "locale": {
         "en": "Locale",
@@ -304,8 +317,11 @@ def test_kokoroplugin_get_setting_display_name_should_accept_required_arguments(
 def test_kokoroplugin_get_setting_display_name_should_require_required_arguments(
     argument: str,
 ) -> None:
-    args = GET_SETTING_DISPLAY_NAME_ARGS.copy()
-    del args[argument]
+    args = {
+        key: value
+        for key, value in GET_SETTING_DISPLAY_NAME_ARGS.items()
+        if key != argument
+    }
     plugin = KokoroPlugin()
     with pytest.raises(TypeError, match="missing 1 required positional argument"):
         plugin.get_setting_display_name(**args)
@@ -345,10 +361,12 @@ def test_kokoroplugin_get_setting_display_name_should_return_fallback_if_locale_
 ## .get_setting_description tests
 
 
-GET_SETTING_DESCRIPTION_ARGS: Final = {
-    "setting_name": "locale",
-    "locale": "en_CA",
-}
+GET_SETTING_DESCRIPTION_ARGS: Final = MappingProxyType(
+    {
+        "setting_name": "locale",
+        "locale": "en_CA",
+    }
+)
 
 
 def test_kokoroplugin_get_setting_description_should_accept_required_arguments(
@@ -362,10 +380,13 @@ def test_kokoroplugin_get_setting_description_should_accept_required_arguments(
 def test_kokoroplugin_get_setting_description_should_require_required_arguments(
     argument: str,
 ) -> None:
-    args = GET_SETTING_DESCRIPTION_ARGS.copy()
-    del args[argument]
+    args = {
+        key: value
+        for key, value in GET_SETTING_DESCRIPTION_ARGS.items()
+        if key != argument
+    }
     plugin = KokoroPlugin()
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         plugin.get_setting_description(**args)
 
 
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Final, cast
+from typing import TYPE_CHECKING, Final
 
 import pytest
 from logot import Logot, logged
@@ -37,13 +37,18 @@ from aquarion.libs.libtts.kokoro.settings import (
     KokoroSettings,
     KokoroVoices,
 )
+from tests.unit.api.conftest import MISSING_ARGUMENT_PATTERN
 from tests.unit.kokoro.conftest import (
     EXPECTED_SETTING_DESCRIPTIONS,
     INVALID_SETTINGS_CASES,
+    PATH_SETTING_NAMES,
     SETTINGS_ARGS,
     SettingsDict,
 )
 
+if TYPE_CHECKING:
+    import re
+
 SETTINGS_ATTRS: Final = [*list(SETTINGS_ARGS), "lang_code"]
 
 
@@ -51,44 +56,40 @@ SETTINGS_ATTRS: Final = [*list(SETTINGS_ARGS), "lang_code"]
 
 
 def test_kokorosettings_should_accept_attributes_as_kwargs(
-    real_settings_path_args: SettingsDict,
+    real_settings_args: SettingsDict,
 ) -> None:
-    arguments = SETTINGS_ARGS.copy()
-    arguments.update(real_settings_path_args)
-    KokoroSettings(**arguments)  # type:ignore[arg-type]
+    KokoroSettings(**real_settings_args)  # type:ignore[arg-type]
 
 
 def test_kokorosettings_should_only_accept_keyword_arguments(
-    real_settings_path_args: SettingsDict,
+    real_settings_args: SettingsDict,
 ) -> None:
-    arguments = SETTINGS_ARGS.copy()
-    arguments.update(real_settings_path_args)
     with pytest.raises(ValueError, match=r"Unexpected positional argument"):
-        KokoroSettings(*arguments.values())
+        KokoroSettings(*real_settings_args.values())
 
 
 @pytest.mark.parametrize("attribute", SETTINGS_ARGS)
 def test_kokorosettings_should_store_given_settings_values(
-    real_settings_path_args: SettingsDict, attribute: str
+    real_settings_args: SettingsDict, attribute: str
 ) -> None:
-    arguments = SETTINGS_ARGS.copy()
-    arguments.update(real_settings_path_args)
-    settings = KokoroSettings(**arguments)  # type:ignore[arg-type]
-    settings_dict = cast("SettingsDict", settings.to_dict())
-    assert settings_dict.get(attribute) == arguments.get(attribute)
+    settings = KokoroSettings(**real_settings_args)  # type:ignore[arg-type]
+    settings_dict = settings.to_dict()
+    assert settings_dict.get(attribute) == real_settings_args.get(attribute)
 
 
 @pytest.mark.parametrize(("attr", "value", "err_msg"), INVALID_SETTINGS_CASES)
 def test_kokorosettings_should_raise_an_exception_if_a_setting_is_invalid(
-    attr: str, value: JSONSerializableTypes, err_msg: str
+    attr: str, value: JSONSerializableTypes, err_msg: re.Pattern[str]
 ) -> None:
     with pytest.raises(ValueError, match=err_msg):
         KokoroSettings(**{attr: value})  # type:ignore[arg-type]
 
 
 @pytest.mark.parametrize(("attr"), SETTINGS_ATTRS)
-def test_kokorosettings_should_have_expected_attributes(attr: str) -> None:
-    settings = KokoroSettings()
+def test_kokorosettings_should_have_expected_attributes(
+    attr: str, default_settings: KokoroSettings
+) -> None:
+    settings = default_settings
     assert hasattr(settings, attr)
 
 
@@ -97,16 +98,20 @@ def test_kokorosettings_should_not_allow_extra_arguments() -> None:
         KokoroSettings(extra_argument="value")  # type:ignore[call-arg]
 
 
-def test_kokorosettings_should_not_allow_extra_attributes() -> None:
-    settings = KokoroSettings()
+def test_kokorosettings_should_not_allow_extra_attributes(
+    default_settings: KokoroSettings,
+) -> None:
+    settings = default_settings
     # This exception message is really cryptic and unhelpful.  But the effect works.
     with pytest.raises(TypeError, match="an instance or subtype of type"):
         settings.extra_attribute = "value"  # type:ignore[attr-defined]
 
 
 @pytest.mark.parametrize(("attr"), SETTINGS_ARGS)
-def test_kokorosettings_should_be_immutable(attr: str) -> None:
-    settings = KokoroSettings()
+def test_kokorosettings_should_be_immutable(
+    attr: str, default_settings: KokoroSettings
+) -> None:
+    settings = default_settings
     with pytest.raises(AttributeError, match=f"cannot assign to field '{attr}'"):
         setattr(settings, attr, getattr(settings, attr))  # type:ignore[misc]
 
@@ -154,21 +159,23 @@ def test_kokorosettings_should_accept_supported_voices(locale: str, voice: str)
     assert str(settings.locale) == locale
 
 
-def test_kokorosettings_should_coerce_voice_strings_to_enum_on_instantiation() -> None:
-    settings = KokoroSettings(voice="af_heart")  # type:ignore[arg-type]
-    assert settings.voice == KokoroVoices.af_heart
-    assert isinstance(settings.voice, KokoroVoices)
-
-
-def test_kokorosettings_should_coerce_device_strings_to_enum_on_instantiation() -> None:
-    settings = KokoroSettings(device="cpu")  # type:ignore[arg-type]
-    assert settings.device == KokoroDeviceTypes.cpu
-    assert isinstance(settings.device, KokoroDeviceTypes)
-
-
 @pytest.mark.parametrize(
-    "attribute", [attr for attr in SETTINGS_ARGS if attr.endswith("_path")]
+    ("attr", "value", "expected"),
+    [
+        ("voice", "af_heart", KokoroVoices.af_heart),
+        ("device", "cpu", KokoroDeviceTypes.cpu),
+    ],
 )
+def test_kokorosettings_should_coerce_strings_to_enums_on_instantiation(
+    attr: str, value: str, expected: KokoroVoices | KokoroDeviceTypes
+) -> None:
+    settings = KokoroSettings(**{attr: value})  # type:ignore[arg-type]
+    actual = getattr(settings, attr)  # type:ignore[misc]
+    assert actual == expected  # type:ignore[misc]
+    assert isinstance(actual, type(expected))  # type:ignore[misc]
+
+
+@pytest.mark.parametrize("attribute", PATH_SETTING_NAMES)
 def test_kokorosettings_should_raise_an_error_if_file_path_does_not_exist(
     attribute: str,
 ) -> None:
@@ -199,21 +206,21 @@ def test_kokorosettings_lang_code_should_return_the_correct_language_code(
 
 def test_kokorosettings_to_dict_should_return_voice_as_a_string() -> None:
     settings = KokoroSettings(voice=KokoroVoices.af_heart)
-    settings_dict = cast("SettingsDict", settings.to_dict())
+    settings_dict = settings.to_dict()
     assert isinstance(settings_dict["voice"], str)
     assert settings_dict["voice"] == "af_heart"
 
 
 def test_kokorosettings_to_dict_should_return_device_as_a_string() -> None:
     settings = KokoroSettings(device=KokoroDeviceTypes.cuda)
-    settings_dict = cast("SettingsDict", settings.to_dict())
+    settings_dict = settings.to_dict()
     assert isinstance(settings_dict["device"], str)
     assert settings_dict["device"] == "cuda"
 
 
 def test_kokorosettings_to_dict_should_log_dictionary_creation(logot: Logot) -> None:
     settings = KokoroSettings(device=KokoroDeviceTypes.cuda)
-    settings_dict = cast("SettingsDict", settings.to_dict())
+    settings_dict = settings.to_dict()
     logot.assert_logged(
         logged.debug(f"KokoroSettings dictionary created: {settings_dict!s}")
     )
@@ -253,7 +260,7 @@ def test_kokorosettings_get_setting_display_name_should_accept_a_setting_name()
 def test_kokorosettings_get_setting_display_name_should_require_a_setting_name(
     # Force line wrap in Ruff.
 ) -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         KokoroSettings._get_setting_display_name()  # type:ignore[call-arg]  # noqa: SLF001
 
 
@@ -290,7 +297,7 @@ def test_kokorosettings_get_setting_description_should_accept_a_setting_name() -
 def test_kokorosettings_get_setting_description_should_require_a_setting_name(
     # Force line wrap in Ruff.
 ) -> None:
-    with pytest.raises(TypeError, match=r"missing .* required positional argument"):
+    with pytest.raises(TypeError, match=MISSING_ARGUMENT_PATTERN):
         KokoroSettings._get_setting_description()  # type:ignore[call-arg]  # noqa: SLF001
 
 
@@ -305,14 +312,18 @@ def test_kokorosettings_get_setting_description_should_return_the_description(
 ## ITTSSettings Protocol Conformity ##
 
 
-def test_kokorosettings_should_conform_to_the_ittssettings_protocol() -> None:
-    settings = KokoroSettings()
+def test_kokorosettings_should_conform_to_the_ittssettings_protocol(
+    default_settings: KokoroSettings,
+) -> None:
+    settings = default_settings
     _: ITTSSettings = settings  # Typecheck protocol conformity
     assert isinstance(settings, ITTSSettings)  # Runtime check as well
 
 
-def test_kokorosettings_should_have_a_locale_attribute() -> None:
-    settings: ITTSSettings = KokoroSettings()
+def test_kokorosettings_should_have_a_locale_attribute(
+    default_settings: KokoroSettings,
+) -> None:
+    settings: ITTSSettings = default_settings
     assert isinstance(settings.locale, str)
 
 
@@ -324,19 +335,23 @@ def test_kokorosettings_to_dict_should_return_a_dict_of_all_settings_as_base_typ
     attr: str, value: JSONSerializableTypes
 ) -> None:
     settings = KokoroSettings(**{attr: value})  # type:ignore[arg-type]
-    settings_dict = cast("SettingsDict", settings.to_dict())
+    settings_dict = settings.to_dict()
     assert settings_dict.get(attr) == value
 
 
-def test_kokorosettings_should_equate_if_setting_values_are_equal() -> None:
-    settings1 = KokoroSettings()
+def test_kokorosettings_should_equate_if_setting_values_are_equal(
+    default_settings: KokoroSettings,
+) -> None:
+    settings1 = default_settings
     settings2 = KokoroSettings()
     assert settings1 == settings2
     assert settings1 is not settings2
 
 
-def test_kokorosettings_should_not_equate_if_setting_values_are_different() -> None:
-    settings1 = KokoroSettings()
+def test_kokorosettings_should_not_equate_if_setting_values_are_different(
+    default_settings: KokoroSettings,
+) -> None:
+    settings1 = default_settings
     settings2 = KokoroSettings(locale="en-GB", voice=KokoroVoices.bf_emma)
     assert settings1 != settings2
     assert settings1 is not settings2